@@ -1 +1 @@
-from .arweave_lib import Wallet, Transaction, arql,Utils
+from .arweave_lib import Wallet, Transaction, arql, Utils, ArweaveTransactionException
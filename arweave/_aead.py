@@ -0,0 +1,63 @@
+import logging
+import os
+
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from ._b64 import b64url_decode
+
+logger = logging.getLogger(__name__)
+
+NONCE_SIZE = 12
+
+try:
+    from cryptography.hazmat.backends.openssl.backend import backend as _openssl
+    from ._cpu import HAS_AES_NI
+    # OpenSSL selects AES-NI/PCLMULQDQ GCM code paths at runtime; log the
+    # linked version so the active backend can be checked on the host.
+    logger.debug("AES-GCM via %s (host AES-NI=%s)", _openssl.openssl_version_text(), HAS_AES_NI)
+except ImportError:  # pragma: no cover - backend introspection is best-effort
+    pass
+
+
+def _normalize_key(key):
+    # Accept raw 16/24/32-byte keys as well as the urlsafe-base64 keys that
+    # Fernet.generate_key() produces, so existing callers keep working.
+    if isinstance(key, str):
+        key = key.encode('ascii')
+    if len(key) == 44:
+        key = b64url_decode(key)
+    return key[:32]
+
+
+def encrypt(data, key):
+    # Single-pass AEAD: the 12-byte nonce is prefixed to the ciphertext
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    nonce = os.urandom(NONCE_SIZE)
+    return nonce + AESGCM(_normalize_key(key)).encrypt(nonce, data, None)
+
+
+def generate_nonces(count):
+    # One urandom syscall covers the whole batch; the kernel pool is already
+    # seeded from hardware randomness, so a single large draw is strictly
+    # cheaper than one syscall per nonce
+    buf = os.urandom(NONCE_SIZE * count)
+    return [buf[i * NONCE_SIZE:(i + 1) * NONCE_SIZE] for i in range(count)]
+
+
+def encrypt_many(datas, key):
+    # Batch variant of encrypt: one key schedule and one nonce draw for the
+    # whole list
+    aesgcm = AESGCM(_normalize_key(key))
+    nonces = generate_nonces(len(datas))
+    encrypted = []
+    for data, nonce in zip(datas, nonces):
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        encrypted.append(nonce + aesgcm.encrypt(nonce, data, None))
+    return encrypted
+
+
+def decrypt(token, key):
+    nonce, ciphertext = token[:NONCE_SIZE], token[NONCE_SIZE:]
+    return AESGCM(_normalize_key(key)).decrypt(nonce, ciphertext, None)
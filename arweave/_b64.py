@@ -0,0 +1,66 @@
+import logging
+import re
+
+try:
+    import pybase64 as _codec
+    PYBASE64_ACTIVE = True
+except ImportError:  # pragma: no cover - pybase64 is a hard dependency of the wheel
+    import base64 as _codec
+    PYBASE64_ACTIVE = False
+
+logger = logging.getLogger(__name__)
+
+
+def b64url_encode(data):
+    # Unpadded base64url per RFC 4648 section 5, matching jose.utils.base64url_encode
+    return _codec.urlsafe_b64encode(data).rstrip(b'=')
+
+
+def b64url_decode(data):
+    if isinstance(data, str):
+        data = data.encode('ascii')
+    return _codec.urlsafe_b64decode(data + b'=' * (-len(data) % 4))
+
+
+# base64url shape check for deserialized fields. Hyperscan (optional extra)
+# compiles the pattern to a DFA scanned in O(n) with no backtracking; the
+# fallback is a precompiled stdlib regex.
+_B64URL_PATTERN = rb'^[A-Za-z0-9_\-]+=*$'
+_B64URL_RE = re.compile(_B64URL_PATTERN)
+
+try:
+    import hyperscan
+    _b64_db = hyperscan.Database()
+    _b64_db.compile(expressions=[_B64URL_PATTERN], flags=[hyperscan.HS_FLAG_SINGLEMATCH])
+    HYPERSCAN_ACTIVE = True
+except ImportError:  # pragma: no cover - hyperscan is an optional extra
+    _b64_db = None
+    HYPERSCAN_ACTIVE = False
+
+
+def is_b64url(value):
+    # Anything that is not text or bytes (numbers, null, ...) cannot be a
+    # base64url field; empty fields (unset target, signature, ...) are valid
+    # on the wire
+    if isinstance(value, str):
+        value = value.encode('ascii', 'replace')
+    elif not isinstance(value, (bytes, bytearray)):
+        return False
+    if not value:
+        return True
+
+    if HYPERSCAN_ACTIVE:
+        matched = []
+        _b64_db.scan(value, match_event_handler=lambda *args: matched.append(True))
+        return bool(matched)
+
+    return _B64URL_RE.match(value) is not None
+
+
+if PYBASE64_ACTIVE:
+    # pybase64 picks its SIMD codec (SSSE3/AVX/AVX2) at import time; surface the
+    # selection so it can be checked from logs on the deployment host.
+    from ._cpu import HAS_AVX2
+    logger.debug("pybase64 %s in use (host AVX2=%s)", _codec.get_version(), HAS_AVX2)
+else:
+    logger.debug("pybase64 unavailable, falling back to stdlib base64")
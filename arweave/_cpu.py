@@ -0,0 +1,28 @@
+import logging
+import platform
+
+logger = logging.getLogger(__name__)
+
+# Capability vector evaluated once at import. The native backends (pybase64,
+# OpenSSL's SHA/AES code paths) do their own runtime dispatch; these flags
+# exist so call sites and logs can assert which paths are active without
+# re-probing CPUID in hot code.
+HAS_AES_NI = False
+HAS_SHA_NI = False
+HAS_AVX2 = False
+HAS_VPCLMULQDQ = False
+
+if platform.machine() in ('x86_64', 'AMD64'):
+    try:
+        from cpufeature import CPUFeature
+        HAS_AES_NI = bool(CPUFeature.get('AES'))
+        HAS_SHA_NI = bool(CPUFeature.get('SHA'))
+        HAS_AVX2 = bool(CPUFeature.get('AVX2'))
+        HAS_VPCLMULQDQ = bool(CPUFeature.get('VPCLMULQDQ'))
+    except ImportError:  # pragma: no cover - cpufeature is an optional extra
+        pass
+
+logger.debug(
+    "cpu features: AES-NI=%s SHA-NI=%s AVX2=%s VPCLMULQDQ=%s",
+    HAS_AES_NI, HAS_SHA_NI, HAS_AVX2, HAS_VPCLMULQDQ
+)
@@ -1,12 +1,20 @@
+import asyncio
+import functools
 import json
 import os
 import io
+import time
+import httpx
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 import hashlib
 import psutil
 import arrow
 import nacl.bindings
+import zstandard
 from jose import jwk
 from jose.utils import base64url_encode, base64url_decode, base64
 from jose.backends.cryptography_backend import CryptographyRSAKey
@@ -24,6 +32,8 @@ from .utils import (
     decode_tag,
     base64url_decode
 )
+from ._aead import encrypt as aead_encrypt, encrypt_many as aead_encrypt_many
+from ._b64 import b64url_encode, b64url_decode, is_b64url
 from .deep_hash import deep_hash
 from .merkle import compute_root_hash, generate_transaction_chunks
 from typing import List
@@ -33,9 +43,40 @@ logger = logging.getLogger(__name__)
 TRANSACTION_DATA_LIMIT_IN_BYTES = 2000000
 API_URL = "https://arweave.net"
 
+# One pooled session for all gateway traffic: keepalive and TLS session
+# resumption amortize connection setup across calls, and transient gateway
+# errors are retried with backoff.
+_SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+)
+_SESSION.mount('http://', _adapter)
+_SESSION.mount('https://', _adapter)
+
+# Built once at import so the compression context is reused across calls;
+# threads=-1 enables multi-threaded frame compression on multi-core hosts.
+_ZSTD = zstandard.ZstdCompressor(level=3, threads=-1, write_checksum=False)
+_ZSTD_DEC = zstandard.ZstdDecompressor()
+
 class ArweaveTransactionException(Exception):
     pass
 
+
+@functools.lru_cache(maxsize=32)
+def _load_jwk(jwk_file, mtime_ns, size):
+    # Parsing the JWK and rebuilding the RSA key (CRT precompute included) is
+    # the expensive part of wallet construction; cache it keyed on the file's
+    # identity so repeated Wallet(path) calls reuse the parsed objects.
+    with open(jwk_file, 'r') as j_file:
+        jwk_data = json.loads(j_file.read())
+    jwk_data['p2s'] = ''
+    jwk_obj = jwk.construct(jwk_data, algorithm=jwk.ALGORITHMS.RS256)
+    rsa_key = RSA.importKey(jwk_obj.to_pem())
+    owner = jwk_data.get('n')
+    return jwk_data, jwk_obj, rsa_key, owner, owner_to_address(owner)
+
 class Wallet:
     """
     Represents an Arweave wallet for managing transactions and cryptographic operations.
@@ -48,15 +89,22 @@ class Wallet:
         self.jwk_data['p2s'] = ''
         self.jwk = jwk.construct(self.jwk_data, algorithm=jwk.ALGORITHMS.RS256)
         self.rsa = RSA.importKey(self.jwk.to_pem())
+        self._signer = PKCS1_PSS.new(self.rsa)
         self.owner = self.jwk_data.get('n')
         self.address = owner_to_address(self.owner)
         self.api_url = API_URL
 
     def __init__(self, jwk_file='jwk_file.json'):
-        # Initialize wallet from a JWK file
-        with open(jwk_file, 'r') as j_file:
-            self.jwk_data = json.loads(j_file.read())
-        self._set_jwk_params()
+        # Initialize wallet from a JWK file, reusing the cached parse when the
+        # file has not changed since it was last loaded
+        stat = os.stat(jwk_file)
+        jwk_data, self.jwk, self.rsa, self.owner, self.address = _load_jwk(
+            jwk_file, stat.st_mtime_ns, stat.st_size)
+        # Share the expensive key objects but give each wallet its own dict;
+        # callers may mutate jwk_data and must not corrupt the cached copy
+        self.jwk_data = dict(jwk_data)
+        self._signer = PKCS1_PSS.new(self.rsa)
+        self.api_url = API_URL
 
     @classmethod
     def from_data(cls, jwk_data):
@@ -70,16 +118,17 @@ class Wallet:
     def balance(self):
         # Fetch and convert the wallet's balance from Winston to AR
         url = f"{self.api_url}/wallet/{self.address}/balance"
-        response = requests.get(url)
+        response = _SESSION.get(url)
         if response.status_code == 200:
             return winston_to_ar(response.text)
         else:
             raise ArweaveTransactionException(response.text)
 
     def sign(self, message):
-        # Sign a message using the wallet's RSA key
+        # Sign a message using the wallet's cached PSS signer; the RSA key's
+        # CRT parameters are computed once at import and reused per call
         h = SHA256.new(message)
-        return PKCS1_PSS.new(self.rsa).sign(h)
+        return self._signer.sign(h)
 
     def verify(self):
         # Placeholder for verification logic
@@ -88,7 +137,7 @@ class Wallet:
     def get_last_transaction_id(self):
         # Retrieve the last transaction ID from the Arweave network
         url = f"{self.api_url}/tx_anchor"
-        response = requests.get(url)
+        response = _SESSION.get(url)
         if response.status_code == 200:
             self.last_tx = response.text
             return self.last_tx
@@ -109,65 +158,63 @@ class Wallet:
         self.logger = logging.getLogger(__name__)
         self.logger.debug("Advanced logging enabled for Wallet.")
 
-    class Transaction:
+class Transaction:
 
-        def __init__(self, wallet, **kwargs):
+    def __init__(self, wallet, **kwargs):
         # Initialize transaction with wallet and optional arguments
-            self.jwk_data = wallet.jwk_data
-            self.jwk = jwk.construct(self.jwk_data, algorithm="RS256")
-            self.wallet = wallet
-            self.id = kwargs.get('id', '')
-            self.last_tx = wallet.get_last_transaction_id()
-            self.owner = self.jwk_data.get('n')
-            self.tags = []
-            self.format = kwargs.get('format', 2)
-
-            self.api_url = API_URL
-            self.chunks = None
-
-            data = kwargs.get('data', '')
-            self.data_size = len(data)
-
-            if isinstance(data, bytes):
-                self.data = base64url_encode(data)
-            else:
-                self.data = base64url_encode(data.encode('utf-8'))
-
-            if self.data is None:
-                self.data = ''
+        self.jwk_data = wallet.jwk_data
+        self.jwk = jwk.construct(self.jwk_data, algorithm="RS256")
+        self.wallet = wallet
+        self.id = kwargs.get('id', '')
+        self.last_tx = wallet.get_last_transaction_id()
+        self.owner = self.jwk_data.get('n')
+        self.tags = []
+        self.format = kwargs.get('format', 2)
 
-            self.file_handler = kwargs.get('file_handler', None)
-            if self.file_handler:
-                self.uses_uploader = True
-                self.data_size = os.stat(kwargs['file_path']).st_size
-            else:
-                self.uses_uploader = False
+        self.api_url = API_URL
+        self.chunks = None
+        self._chunk_cache = {}
+
+        # Encode the payload once: a single buffer feeds both the size and
+        # the base64url encode, with no intermediate bytes/str round trips
+        data = kwargs.get('data', '')
+        buf = data.encode('utf-8') if isinstance(data, str) else bytes(data)
+        self.data_size = len(buf)
+        self.data = b64url_encode(buf).decode('ascii')
+
+        self.file_handler = kwargs.get('file_handler', None)
+        if self.file_handler:
+            self.uses_uploader = True
+            self.data_size = os.stat(kwargs['file_path']).st_size
+        else:
+            self.uses_uploader = False
 
-            if kwargs.get('transaction'):
-                self.from_serialized_transaction(kwargs.get('transaction'))
-            else:
-                self.data_root = ""
-                self.data_tree = []
-                self.target = kwargs.get('target', '')
-                self.to = kwargs.get('to', '')
+        if kwargs.get('transaction'):
+            self.to = ''
+            self.from_serialized_transaction(kwargs.get('transaction'))
+        else:
+            self.data_root = ""
+            self.data_tree = []
+            self.target = kwargs.get('target', '')
+            self.to = kwargs.get('to', '')
 
-            if self.target == '' and self.to != '':
-                self.target = self.to
+        if self.target == '' and self.to != '':
+            self.target = self.to
 
-            self.quantity = kwargs.get('quantity', '0')
-            if float(self.quantity) > 0:
-                if self.target == '':
-                    raise ArweaveTransactionException(
-                        f"Unable to send {self.quantity} AR without specifying a target address"
-                    )
-                self.quantity = ar_to_winston(float(self.quantity))
+        self.quantity = kwargs.get('quantity', '0')
+        if float(self.quantity) > 0:
+            if self.target == '':
+                raise ArweaveTransactionException(
+                    f"Unable to send {self.quantity} AR without specifying a target address"
+                )
+            self.quantity = ar_to_winston(float(self.quantity))
 
-            reward = kwargs.get('reward', None)
-            if reward is not None:
-                self.reward = reward
+        reward = kwargs.get('reward', None)
+        if reward is not None:
+            self.reward = reward
 
-            self.signature = ''
-            self.status = None
+        self.signature = ''
+        self.status = None
 
     def from_serialized_transaction(self, transaction_json):
         # Load transaction from JSON data
@@ -181,19 +228,66 @@ class Wallet:
         url = f"{self.api_url}/price/{data_size}"
         if target_address:
             url = f"{self.api_url}/price/{data_size}/{target_address}"
-        response = requests.get(url)
+        response = _SESSION.get(url)
         if response.status_code == 200:
             return response.text
         return None
 
+    @property
+    def tags(self):
+        # Materialize the backward-compatible list of tag dicts from the
+        # contiguous name/value buffers
+        names = self._tag_names
+        values = self._tag_values
+        tags = []
+        for ns, ne, vs, ve, name_is_str, value_is_str in self._tag_offsets:
+            name = bytes(names[ns:ne])
+            value = bytes(values[vs:ve])
+            tags.append({
+                'name': name.decode('utf-8') if name_is_str else name,
+                'value': value.decode('utf-8') if value_is_str else value
+            })
+        return tags
+
+    @tags.setter
+    def tags(self, tags):
+        # Tags are stored SoA-style: names and values in two contiguous
+        # buffers plus an offset table, so encoding walks flat memory instead
+        # of a list of per-tag dicts
+        self._tag_names = bytearray()
+        self._tag_values = bytearray()
+        self._tag_offsets = []
+        for tag in tags:
+            self._append_tag(tag['name'], tag['value'])
+
+    def _append_tag(self, name, value):
+        name_is_str = isinstance(name, str)
+        value_is_str = isinstance(value, str)
+        name_b = name.encode('utf-8') if name_is_str else bytes(name)
+        value_b = value.encode('utf-8') if value_is_str else bytes(value)
+        ns = len(self._tag_names)
+        vs = len(self._tag_values)
+        self._tag_names += name_b
+        self._tag_values += value_b
+        self._tag_offsets.append((ns, ns + len(name_b), vs, vs + len(value_b), name_is_str, value_is_str))
+
     def add_tag(self, name, value):
         # Add a tag to the transaction
         tag = create_tag(name, value, self.format == 2)
-        self.tags.append(tag)
+        self._append_tag(tag['name'], tag['value'])
 
     def encode_tags(self):
-        # Encode tags for JSON serialization
-        self.tags = [encode_tag(tag) for tag in self.tags]
+        # Encode tags for JSON serialization in one pass over the contiguous
+        # buffers; each slice goes straight into the SIMD base64 codec
+        names = memoryview(self._tag_names)
+        values = memoryview(self._tag_values)
+        self.tags = [
+            {
+                'name': b64url_encode(names[ns:ne]).decode(),
+                'value': b64url_encode(values[vs:ve]).decode()
+            }
+            for ns, ne, vs, ve, _, _ in self._tag_offsets
+        ]
 
     def sign(self):
         # Sign the transaction
@@ -258,7 +352,7 @@ class Wallet:
         url = f"{self.api_url}/tx"
         headers = {'Content-Type': 'application/json', 'Accept': 'text/plain'}
         json_data = self.json_data
-        response = requests.post(url, data=json_data, headers=headers)
+        response = _SESSION.post(url, data=json_data, headers=headers)
         logger.debug(f"{response.text}\n\n{json_data}")
         return self.last_tx
 
@@ -270,8 +364,8 @@ class Wallet:
             'last_tx': self.last_tx,
             'owner': self.owner,
             'quantity': self.quantity,
-            'reward': self.reward,
-            'signature': self.signature.decode(),
+            'reward': getattr(self, 'reward', '0'),
+            'signature': self.signature.decode() if isinstance(self.signature, bytes) else self.signature,
             'tags': self.tags,
             'target': self.target
         }
@@ -291,18 +385,19 @@ class Wallet:
 
     @property
     def json_data(self):
-        # Convert transaction to JSON string
+        # Convert transaction to JSON string; orjson already emits compact
+        # output with no separator whitespace
         data = self.to_dict()
-        json_str = json.dumps(data)
+        json_str = orjson.dumps(data).decode()
         logger.debug(json_str)
-        return json_str.replace(' ', '')
+        return json_str
 
     def get_status(self):
         # Get transaction status from the network
         url = f"{self.api_url}/tx/{self.id}/status"
-        response = requests.get(url)
+        response = _SESSION.get(url)
         if response.status_code == 200:
-            self.status = json.loads(response.text)
+            self.status = orjson.loads(response.text)
         else:
             logger.error(response.text)
             self.status = "PENDING"
@@ -311,7 +406,7 @@ class Wallet:
     def get_transaction(self):
         # Retrieve transaction details
         url = f"{self.api_url}/tx/{self.id}"
-        response = requests.get(url)
+        response = _SESSION.get(url)
         if response.status_code == 200:
             self.load_json(response.text)
         else:
@@ -321,7 +416,7 @@ class Wallet:
     def get_price(self):
         # Get the price for the transaction
         url = f"{self.api_url}/price/{self.data_size}"
-        response = requests.get(url)
+        response = _SESSION.get(url)
         if response.status_code == 200:
             return winston_to_ar(response.text)
         else:
@@ -330,7 +425,7 @@ class Wallet:
     def get_data(self):
         # Fetch the data of the transaction
         url = f"{self.api_url}/{self.id}/"
-        response = requests.get(url)
+        response = _SESSION.get(url)
         if response.status_code == 200:
             self.data = response.content
         else:
@@ -339,7 +434,10 @@ class Wallet:
 
     def load_json(self, json_str):
         # Load transaction details from JSON string
-        json_data = json.loads(json_str)
+        json_data = orjson.loads(json_str)
+        for field in ('data', 'owner', 'signature', 'target', 'last_tx', 'data_root'):
+            if not is_b64url(json_data.get(field, '')):
+                raise ArweaveTransactionException(f"Invalid base64url value for field '{field}'")
         self.data = json_data.get('data', '')
         self.last_tx = json_data.get('last_tx', '')
         self.owner = json_data.get('owner', '')
@@ -357,7 +455,7 @@ class Wallet:
         # Prepare chunks for large data transactions
         if not self.chunks:
             self.chunks = generate_transaction_chunks(self.file_handler)
-            self.data_root = base64url_encode(self.chunks.get('data_root'))
+            self.data_root = b64url_encode(self.chunks.get('data_root'))
 
         if not self.chunks:
             self.chunks = {
@@ -367,28 +465,42 @@ class Wallet:
             }
             self.data_root = ''
 
+    def _encoded_chunk(self, idx):
+        # Retry loops re-request the same chunks; keep the few most recently
+        # encoded ones so a re-send is a dict lookup instead of a fresh
+        # read() and base64 pass
+        cached = self._chunk_cache.get(idx)
+        if cached is not None:
+            return cached
+
+        chunk = self.chunks.get('chunks')[idx]
+        self.file_handler.seek(chunk.min_byte_range)
+        chunk_data = self.file_handler.read(chunk.data_size)
+        encoded = b64url_encode(chunk_data)
+
+        if len(self._chunk_cache) >= 8:
+            self._chunk_cache.pop(next(iter(self._chunk_cache)))
+        self._chunk_cache[idx] = encoded
+        return encoded
+
     def get_chunk(self, idx):
         # Retrieve a specific chunk of the transaction data
         if self.chunks is None:
             raise ArweaveTransactionException("Chunks have not been prepared")
 
         proof = self.chunks.get('proofs')[idx]
-        chunk = self.chunks.get('chunks')[idx]
-        
-        self.file_handler.seek(chunk.min_byte_range)
-        chunk_data = self.file_handler.read(chunk.data_size)
 
         return {
             "data_root": self.data_root.decode(),
             "data_size": str(self.data_size),
-            "data_path": base64url_encode(proof.proof),
+            "data_path": b64url_encode(proof.proof),
             "offset": str(proof.offset),
-            "chunk": base64url_encode(chunk_data)
+            "chunk": self._encoded_chunk(idx)
         }
 
     def estimate_transaction_fee(self):
         # Estimate the fee for the transaction
-        response = requests.get(f"{self.api_url}/price")
+        response = _SESSION.get(f"{self.api_url}/price")
         if response.status_code == 200:
             return int(response.text)
         else:
@@ -404,10 +516,10 @@ class Wallet:
 
 def arql(wallet, query):
     # Perform ARQL query to find transactions matching criteria
-    data = json.dumps(query)
+    data = orjson.dumps(query)
     headers = {'Content-type': 'application/json', 'Accept': 'text/plain'}
-    response = requests.post(f"{API_URL}/arql", data=data, headers=headers)
-    return json.loads(response.text) if response.status_code == 200 else None
+    response = _SESSION.post(f"{API_URL}/arql", data=data, headers=headers)
+    return orjson.loads(response.text) if response.status_code == 200 else None
 
 def arql_with_transaction_data(wallet, query):
     # Fetch transactions with their data using ARQL
@@ -424,7 +536,7 @@ def arql_with_transaction_data(wallet, query):
 
 def estimate_transaction_fee(self):
     # Estimate the fee for a transaction
-    response = requests.get(f"{self.api_url}/price")
+    response = _SESSION.get(f"{self.api_url}/price")
     if response.status_code == 200:
         return int(response.text)
     else:
@@ -438,42 +550,89 @@ def schedule_transaction(self, timestamp: int):
     # Schedule the transaction for future execution
     self.scheduled_time = timestamp
 
+async def _send_all(transactions):
+    # Fan the POSTs out over one HTTP/2 connection so the batch pays a single
+    # TLS handshake and the round trips overlap instead of running serially
+    headers = {'Content-Type': 'application/json', 'Accept': 'text/plain'}
+    limits = httpx.Limits(max_connections=32)
+    async with httpx.AsyncClient(http2=True, limits=limits) as client:
+        return await asyncio.gather(*[
+            client.post(f"{tx.api_url}/tx", content=tx.json_data, headers=headers)
+            for tx in transactions
+        ])
+
+
 class Utils:
-    
+
+    # Confirmation is final, so confirmed statuses are cached and repeated
+    # listens for the same transaction skip the network entirely
+    _confirmed_transactions = {}
+
     @staticmethod
     def listen_for_transaction(tx_id: str, api_url=API_URL):
         # Monitor transaction status until confirmed
+        cached = Utils._confirmed_transactions.get(tx_id)
+        if cached is not None:
+            return cached
+
         url = f"{api_url}/tx/{tx_id}/status"
+        attempt = 0
         while True:
-            response = requests.get(url)
+            response = _SESSION.get(url)
             if response.status_code == 200:
                 status = response.json()
                 if status.get("status") == "confirmed":
+                    if len(Utils._confirmed_transactions) >= 1024:
+                        Utils._confirmed_transactions.pop(next(iter(Utils._confirmed_transactions)))
+                    Utils._confirmed_transactions[tx_id] = status
                     return status
             else:
                 raise ArweaveTransactionException(response.text)
 
+            # Exponential backoff so the poll loop is not a tight spin
+            time.sleep(min(0.2 * 2 ** attempt, 5.0))
+            attempt += 1
+
     @staticmethod
     def send_batch_transactions(wallet, transactions):
+        # The anchor is shared across the batch window, so fetch it once
+        # instead of once per transaction
+        last_tx = wallet.get_last_transaction_id()
         for tx in transactions:
+            tx.last_tx = last_tx
             tx.sign()
-            tx.send()
+        return asyncio.run(_send_all(transactions))
 
     @staticmethod
     def compress_and_store_data(data: str):
         # Compress data for storage efficiency
-        return base64.b64encode(data.encode()).decode()
+        return _ZSTD.compress(data.encode() if isinstance(data, str) else data)
+
+    @staticmethod
+    def decompress_stored_data(data: bytes):
+        # Decompress data previously produced by compress_and_store_data
+        return _ZSTD_DEC.decompress(data)
 
     @staticmethod
     def encrypt_and_store(data: str, key: str):
-        # Encrypt data before storing on Arweave
+        # Encrypt data before storing on Arweave (AES-256-GCM, nonce-prefixed)
+        return aead_encrypt(data, key)
+
+    @staticmethod
+    def encrypt_and_store_batch(datas: List[str], key: str):
+        # Encrypt a batch with one key schedule and a single nonce draw
+        return aead_encrypt_many(datas, key)
+
+    @staticmethod
+    def encrypt_and_store_fernet(data: str, key: str):
+        # Legacy Fernet (AES-CBC + HMAC) entry point kept for compatibility
         cipher_suite = Fernet(key)
         return cipher_suite.encrypt(data.encode())
 
     @staticmethod
     def sync_with_blockchain(api_url=API_URL):
         # Get the current blockchain status
-        response = requests.get(f"{api_url}/network/status")
+        response = _SESSION.get(f"{api_url}/network/status")
         if response.status_code == 200:
             return response.json()
         else:
@@ -1,17 +1,54 @@
 import hashlib
+import io
+import logging
+import mmap
+import os
+import ssl
 import struct
 import functools
+from concurrent.futures import ThreadPoolExecutor
 from jose.utils import base64url_encode, base64url_decode
 from .file_io import read_file_chunks
 from .utils import concat_buffers
 from json import JSONEncoder
 
+logger = logging.getLogger(__name__)
+
 CHUNK_SIZE = 256 * 1024
 NOTE_SIZE = 32
 HASH_SIZE = 32
 MAX_CHUNK_SIZE = 256 * 1024
 MIN_CHUNK_SIZE = 32 * 1024
 
+# hashlib's sha256 is backed by OpenSSL, which dispatches to SHA-NI/AVX2
+# compressors at runtime; log the linked version so the active backend can
+# be checked from the logs.
+HASH_WORKERS = min(8, os.cpu_count() or 1)
+logger.debug("sha256 backend: %s (available: %s)", ssl.OPENSSL_VERSION, 'sha256' in hashlib.algorithms_available)
+
+
+def _hash_chunks(raw_chunks):
+    # hashlib.sha256 releases the GIL for inputs larger than 2047 bytes, so
+    # 256 KiB chunks hash in parallel across cores.
+    if len(raw_chunks) > 1 and HASH_WORKERS > 1:
+        with ThreadPoolExecutor(max_workers=HASH_WORKERS) as pool:
+            return list(pool.map(lambda chunk: hashlib.sha256(chunk).digest(), raw_chunks))
+
+    return [hashlib.sha256(chunk).digest() for chunk in raw_chunks]
+
+
+def _mmap_file(file_handler):
+    # Map real files read-only so chunking slices the page cache directly
+    # instead of allocating a fresh bytes object per read(); in-memory and
+    # empty handlers fall back to the generator path.
+    try:
+        fileno = file_handler.fileno()
+        if os.fstat(fileno).st_size == 0:
+            return None
+        return mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+    except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+        return None
+
 
 class NodeTypeException(Exception):
     pass
@@ -102,18 +139,34 @@ def chunk_data(file_handler):
     chunks = [];
     chadd = chunks.append
 
-    cursor = 0
+    mm = _mmap_file(file_handler)
+    if mm is not None:
+        with mm:
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
 
-    for chunk in read_file_chunks(file_handler, MAX_CHUNK_SIZE):
-        data_hash = hashlib.sha256(chunk).digest()
+            view = memoryview(mm)
+            raw_chunks = [view[off:off + MAX_CHUNK_SIZE] for off in range(0, len(mm), MAX_CHUNK_SIZE)]
+            sizes = [len(chunk) for chunk in raw_chunks]
+            hashes = _hash_chunks(raw_chunks)
 
-        cursor += len(chunk)
+            del raw_chunks  # release the exported views before closing the map
+            view.release()
+    else:
+        raw_chunks = list(read_file_chunks(file_handler, MAX_CHUNK_SIZE))
+        sizes = [len(chunk) for chunk in raw_chunks]
+        hashes = _hash_chunks(raw_chunks)
+
+    cursor = 0
+
+    for size, data_hash in zip(sizes, hashes):
+        cursor += size
 
         chadd(
             Chunk(
                 data_hash,
-                data_size=len(chunk),
-                min_byte_range=cursor - len(chunk),
+                data_size=size,
+                min_byte_range=cursor - size,
                 max_byte_range=cursor
             )
         )
@@ -147,6 +200,13 @@ def generate_tree(file_handler):
 
 
 def build_layers(nodes, level=0):
+    # Note on memory: intermediate node ids must stay full 32-byte SHA-256
+    # digests. Each id is hashed into its parent's id and serialized verbatim
+    # into the proof paths that gateways validate, so truncating them (e.g.
+    # to 16 bytes to halve the tree's cache footprint) changes the data_root
+    # and breaks proof validation. Peak usage is already bounded: each level
+    # holds half the nodes of the one below, and chunk data itself is never
+    # retained here.
     nodes_lenth = len(nodes)
 
     if nodes_lenth < 2:
@@ -287,6 +347,26 @@ def hash(data):
     return digest
 
 
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_ACTIVE = True
+except ImportError:  # pragma: no cover - numba is an optional extra
+    NUMBA_ACTIVE = False
+
+if NUMBA_ACTIVE:
+    # The per-node big-endian conversions are tight numeric loops that run
+    # once for every node in the tree; let LLVM compile them instead of the
+    # interpreter. The SHA-256 work itself stays in OpenSSL.
+    @njit(cache=True)
+    def _int_to_buffer_nb(note):
+        buffer = np.zeros(NOTE_SIZE, dtype=np.uint8)
+        for i in range(NOTE_SIZE - 1, 0, -1):
+            buffer[i] = note % 256
+            note //= 256
+        return buffer
+
+
 def note_to_buffer(note):
     buffer = b"\x00" * NOTE_SIZE
     buffer = bytearray(buffer)
@@ -305,6 +385,9 @@ def note_to_buffer(note):
 
 
 def int_to_buffer(note):
+    if NUMBA_ACTIVE:
+        return bytearray(_int_to_buffer_nb(note).tobytes())
+
     buffer = b"\x00" * NOTE_SIZE
     buffer = bytearray(buffer)
 
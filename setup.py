@@ -17,10 +17,19 @@ setup(
   install_requires=[
     'arrow',
     'python-jose',
+    'pybase64',
     'pynacl',
     'pycryptodome',
-    'cryptography',
+    'cryptography>=41',
+    'httpx[http2]',
+    'orjson',
     'requests',
-    'psutil'
+    'psutil',
+    'zstandard'
   ],
+  extras_require={
+    'numba': ['numba', 'numpy'],
+    'hyperscan': ['hyperscan'],
+    'cpufeature': ['cpufeature'],
+  },
 )
@@ -2,18 +2,30 @@ import unittest
 from tempfile import TemporaryFile
 import os
 import json
+import logging
 from cryptography.fernet import Fernet
-from flask import logging
 from arweave import Wallet, Transaction, ArweaveTransactionException, Utils
 from jose.utils import base64url_encode, base64url_decode, base64
 
 class TestWalletAndTransaction(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # Wallet construction (disk read + JWK parse + RSA key build) is
+        # immutable and expensive, so do it once for the whole class instead
+        # of before every test
+        cls._shared_wallet = Wallet('jwk_file.json')
+        cls._default_api_url = cls._shared_wallet.api_url
+
     def setUp(self):
-        self.wallet = Wallet('jwk_file.json')
+        self.wallet = self._shared_wallet
         self.test_data = "This is test data"
         self.transaction = Transaction(self.wallet, data=self.test_data)
 
+    def tearDown(self):
+        # Undo any per-test mutation of the shared wallet
+        self.wallet.api_url = self._default_api_url
+
     # Wallet tests
     def test_wallet_init(self):
         self.assertIsNotNone(self.wallet.jwk)